@@ -21,7 +21,6 @@ from toolz import (
     filter,
     remove,
     compose,
-    curry,
     first,
     second,
     accumulate,
@@ -890,17 +889,15 @@ class Bag(DaskMethodsMixin):
         combine = combine or binop
         if initial is not no_default:
             return self.reduction(
-                curry(_reduce, binop, initial=initial),
-                curry(_reduce, combine),
+                partial(_reduce, binop, initial=initial),
+                partial(_reduce, combine),
                 split_every=split_every,
                 out_type=out_type,
             )
         else:
-            from toolz.curried import reduce
-
             return self.reduction(
-                reduce(binop),
-                reduce(combine),
+                partial(reduce, binop),
+                partial(reduce, combine),
                 split_every=split_every,
                 out_type=out_type,
             )
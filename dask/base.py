@@ -1,6 +1,7 @@
 from __future__ import absolute_import, division, print_function
 
 from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import partial
 from hashlib import md5
 from operator import getitem
@@ -967,6 +968,14 @@ def get_scheduler(get=None, scheduler=None, collections=None, cls=None):
             return scheduler
         elif "Client" in type(scheduler).__name__ and hasattr(scheduler, "get"):
             return scheduler.get
+        elif isinstance(scheduler, ProcessPoolExecutor):
+            if "processes" not in named_schedulers:
+                raise ValueError(
+                    "Please install cloudpickle to use the 'processes' scheduler."
+                )
+            return partial(named_schedulers["processes"], pool=scheduler)
+        elif isinstance(scheduler, Executor):
+            return partial(threaded.get, pool=scheduler)
         elif scheduler.lower() in named_schedulers:
             return named_schedulers[scheduler.lower()]
         elif scheduler.lower() in ("dask.distributed", "distributed"):
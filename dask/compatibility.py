@@ -68,6 +68,11 @@ if PY3:
     import copyreg
     import builtins
     from queue import Queue, Empty
+
+    try:
+        from queue import SimpleQueue
+    except ImportError:  # Python < 3.7
+        SimpleQueue = Queue
     from itertools import zip_longest
     from io import StringIO, BytesIO
     from os import makedirs
@@ -139,6 +144,8 @@ else:
     import __builtin__ as builtins
     import copy_reg as copyreg
     from Queue import Queue, Empty
+
+    SimpleQueue = Queue
     from itertools import izip_longest as zip_longest, izip as zip
     from StringIO import StringIO
     from io import BytesIO, BufferedIOBase
@@ -113,15 +113,15 @@ def _execute_task(arg, cache, dsk=None):
     """
     if isinstance(arg, list):
         return [_execute_task(a, cache) for a in arg]
-    elif istask(arg):
+    elif type(arg) is tuple and arg and callable(arg[0]):  # istask, inlined
         func, args = arg[0], arg[1:]
         args2 = [_execute_task(a, cache) for a in args]
         return func(*args2)
-    elif not ishashable(arg):
-        return arg
-    elif arg in cache:
-        return cache[arg]
-    else:
+    # Hash each argument once, rather than once each in ishashable, ``in``
+    # and the lookup.  Non-keys pass through unchanged.
+    try:
+        return cache.get(arg, arg)
+    except TypeError:  # unhashable
         return arg
 
 
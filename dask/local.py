@@ -106,13 +106,16 @@ See the function ``inline_functions`` for more information.
 """
 from __future__ import absolute_import, division, print_function
 
+import logging
+from numbers import Integral
 import os
 
-from .compatibility import Queue, Empty, reraise, PY2
+from .compatibility import SimpleQueue, Empty, reraise, PY2
 from .core import flatten, reverse_dict, get_dependencies, has_tasks, _execute_task
 from . import config
 from .order import order
 from .callbacks import unpack_callbacks, local_callbacks
+from .sizeof import sizeof
 from .utils_test import add, inc  # noqa: F401
 
 
@@ -146,6 +149,8 @@ else:
 
 DEBUG = False
 
+logger = logging.getLogger(__name__)
+
 
 def start_state_from_dask(dsk, cache=None, sortkey=None):
     """ Start state from a dask
@@ -172,15 +177,22 @@ def start_state_from_dask(dsk, cache=None, sortkey=None):
         cache = config.get("cache", None)
     if cache is None:
         cache = dict()
+
+    # Dependencies may refer to keys only present in a pre-populated cache.
+    # Otherwise every cached value also lives in ``dsk``, so avoid copying the
+    # whole graph just to merge them.
+    if cache:
+        dsk2 = dsk.copy()
+        dsk2.update(cache)
+    else:
+        dsk2 = dsk
+
     data_keys = set()
     for k, v in dsk.items():
         if not has_tasks(dsk, v):
             cache[k] = v
             data_keys.add(k)
 
-    dsk2 = dsk.copy()
-    dsk2.update(cache)
-
     dependencies = {k: get_dependencies(dsk2, k) for k in dsk}
     waiting = {k: v.copy() for k, v in dependencies.items() if k not in data_keys}
 
@@ -224,20 +236,37 @@ def execute_task(key, task_info, dumps, loads, get_id, pack_exception):
     """
     Compute task and handle all administration
 
+    Only the result is passed through ``dumps``; the worker id is returned
+    as-is alongside it.
+
     See Also
     --------
     _execute_task - actually execute task
     """
+    id = None
     try:
         task, data = loads(task_info)
         result = _execute_task(task, data)
         id = get_id()
-        result = dumps((result, id))
+        result = dumps(result)
         failed = False
     except BaseException as e:
         result = pack_exception(e, dumps)
         failed = True
-    return key, result, failed
+    return key, result, failed, id
+
+
+def batch_execute_tasks(it, dumps, loads, get_id, pack_exception):
+    """
+    Batch computing of multiple tasks with `execute_task`
+
+    ``it`` holds ``(key, task_info)`` pairs; the remaining arguments are the
+    same for every task and so are sent only once per batch.
+    """
+    return [
+        execute_task(key, task_info, dumps, loads, get_id, pack_exception)
+        for key, task_info in it
+    ]
 
 
 def release_data(key, state, delete=True):
@@ -264,24 +293,31 @@ def finish_task(
 
     Mutates.  This should run atomically (with a lock).
     """
-    for dep in sorted(state["dependents"][key], key=sortkey, reverse=True):
-        s = state["waiting"][dep]
+    waiting = state["waiting"]
+    waiting_data = state["waiting_data"]
+    ready = state["ready"]
+
+    dependents = state["dependents"][key]
+    if len(dependents) > 1:
+        dependents = sorted(dependents, key=sortkey, reverse=True)
+    for dep in dependents:
+        s = waiting[dep]
         s.remove(key)
         if not s:
-            del state["waiting"][dep]
-            state["ready"].append(dep)
+            del waiting[dep]
+            ready.append(dep)
 
     for dep in state["dependencies"][key]:
-        if dep in state["waiting_data"]:
-            s = state["waiting_data"][dep]
+        if dep in waiting_data:
+            s = waiting_data[dep]
             s.remove(key)
             if not s and dep not in results:
-                if DEBUG:
-                    from chest.core import nbytes
-
-                    print(
-                        "Key: %s\tDep: %s\t NBytes: %.2f\t Release"
-                        % (key, dep, sum(map(nbytes, state["cache"].values()) / 1e6))
+                if DEBUG and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Key: %s\tDep: %s\t NBytes: %.2f\t Release",
+                        key,
+                        dep,
+                        sum(map(sizeof, state["cache"].values())) / 1e6,
                     )
                 release_data(dep, state, delete=delete)
         elif delete and dep not in results:
@@ -362,6 +398,7 @@ def get_async(
     callbacks=None,
     dumps=identity,
     loads=identity,
+    chunksize=None,
     **kwargs
 ):
     """ Asynchronous get function
@@ -374,7 +411,9 @@ def get_async(
     Parameters
     ----------
     apply_async : function
-        Asynchronous apply function as found on Pool or ThreadPool
+        Asynchronous apply function as found on Pool or ThreadPool.  Its
+        ``callback`` may be given an exception instead of a result, which is
+        then raised
     num_workers : int
         The number of active tasks we should have at any one time
     dsk : dict
@@ -404,12 +443,34 @@ def get_async(
         Callbacks are passed in as tuples of length 5. Multiple sets of
         callbacks may be passed in as a list of tuples. For more information,
         see the dask.diagnostics documentation.
+    chunksize: int, optional
+        Number of ready tasks to send to a worker in a single call to
+        ``apply_async``.  Use -1 to split all ready tasks evenly across the
+        idle workers.  Defaults to the ``chunksize`` config value, or 1.
+        Above 1, ``pretask`` callbacks run for every task of a batch when the
+        batch is sent, so timings taken from them (as in ``Profiler`` or
+        ``dask.cache.Cache``) include time spent queued behind earlier tasks
+        of the same batch.
 
     See Also
     --------
     threaded.get
     """
-    queue = Queue()
+    if chunksize is None:
+        chunksize = config.get("chunksize", 1)
+    if (
+        isinstance(chunksize, bool)
+        or not isinstance(chunksize, Integral)
+        or not (chunksize > 0 or chunksize == -1)
+    ):
+        raise ValueError(
+            "chunksize must be a positive integer or -1, got %r" % (chunksize,)
+        )
+
+    # Workers hand finished tasks straight back to this loop through an
+    # unbounded queue; ``SimpleQueue`` avoids the condition variables that
+    # ``Queue`` takes on every put and get.
+    queue = SimpleQueue()
 
     if isinstance(result, list):
         result_flat = set(flatten(result))
@@ -439,64 +500,96 @@ def get_async(
                 if start_state:
                     start_state(dsk, state)
 
+            # The containers in ``state`` are only ever mutated in place, so
+            # bind the ones used for every task to locals once
+            cache = state["cache"]
+            dependencies = state["dependencies"]
+            waiting = state["waiting"]
+            ready = state["ready"]
+            running = state["running"]
+
             if rerun_exceptions_locally is None:
                 rerun_exceptions_locally = config.get("rerun_exceptions_locally", False)
 
-            if state["waiting"] and not state["ready"]:
+            if waiting and not ready:
                 raise ValueError("Found no accessible jobs in dask")
 
-            def fire_task():
-                """ Fire off a task to the thread pool """
-                # Choose a good task to compute
-                key = state["ready"].pop()
-                state["running"].add(key)
-                for f in pretask_cbs:
-                    f(key, dsk, state)
-
-                # Prep data to send
-                data = dict(
-                    (dep, state["cache"][dep]) for dep in get_dependencies(dsk, key)
-                )
-                # Submit
-                apply_async(
-                    execute_task,
-                    args=(
-                        key,
-                        dumps((dsk[key], data)),
-                        dumps,
-                        loads,
-                        get_id,
-                        pack_exception,
-                    ),
-                    callback=queue.put,
-                )
-
-            # Seed initial tasks into the thread pool
-            while state["ready"] and len(state["running"]) < num_workers:
-                fire_task()
+            # Arguments shared by every task, packed once per computation
+            static_args = (dumps, loads, get_id, pack_exception)
+
+            def fire_tasks(avail_workers):
+                """ Fire off ready tasks to the idle workers
+
+                Returns the number of batches submitted
+                """
+                nready = len(ready)
+                if chunksize == -1:
+                    ntasks = nready
+                    size = max(-(ntasks // -avail_workers), 1)
+                else:
+                    ntasks = min(nready, chunksize * avail_workers)
+                    size = chunksize
+
+                args = []
+                for _ in range(ntasks):
+                    # Choose a good task to compute
+                    key = ready.pop()
+                    running.add(key)
+                    for f in pretask_cbs:
+                        f(key, dsk, state)
+
+                    # Prep data to send, using the dependencies computed once
+                    # up front rather than walking the task again
+                    data = dict((dep, cache[dep]) for dep in dependencies[key])
+                    args.append((key, dumps((dsk[key], data))))
+
+                # Submit, one call to apply_async per batch
+                for i in range(0, ntasks, size):
+                    apply_async(
+                        batch_execute_tasks,
+                        args=(args[i : i + size],) + static_args,
+                        callback=queue.put,
+                    )
+                return -(ntasks // -size)
+
+            # Number of submitted batches whose results have not come back
+            # yet, i.e. the number of busy workers
+            inflight = 0
 
             # Main loop, wait on tasks to finish, insert new ones
-            while state["waiting"] or state["ready"] or state["running"]:
-                key, res_info, failed = queue_get(queue)
-                if failed:
-                    exc, tb = loads(res_info)
-                    if rerun_exceptions_locally:
-                        data = dict(
-                            (dep, state["cache"][dep])
-                            for dep in get_dependencies(dsk, key)
-                        )
-                        task = dsk[key]
-                        _execute_task(task, data)  # Re-execute locally
-                    else:
-                        raise_exception(exc, tb)
-                res, worker_id = loads(res_info)
-                state["cache"][key] = res
-                finish_task(dsk, key, state, results, keyorder.get)
-                for f in posttask_cbs:
-                    f(key, res, dsk, state, worker_id)
-
-                while state["ready"] and len(state["running"]) < num_workers:
-                    fire_task()
+            while waiting or ready or running:
+                if inflight < num_workers:
+                    inflight += fire_tasks(num_workers - inflight)
+
+                # Block for one batch of results, then take everything else
+                # that has finished in the meantime before refilling the pool
+                batches = [queue_get(queue)]
+                while True:
+                    try:
+                        batches.append(queue.get_nowait())
+                    except Empty:
+                        break
+                inflight -= len(batches)
+
+                for batch in batches:
+                    if isinstance(batch, BaseException):
+                        raise batch
+                    for key, res_info, failed, worker_id in batch:
+                        if failed:
+                            exc, tb = loads(res_info)
+                            if rerun_exceptions_locally:
+                                data = dict(
+                                    (dep, cache[dep]) for dep in dependencies[key]
+                                )
+                                task = dsk[key]
+                                _execute_task(task, data)  # Re-execute locally
+                            else:
+                                raise_exception(exc, tb)
+                        res = loads(res_info)
+                        cache[key] = res
+                        finish_task(dsk, key, state, results, keyorder.get)
+                        for f in posttask_cbs:
+                            f(key, res, dsk, state, worker_id)
 
             succeeded = True
 
@@ -523,6 +616,31 @@ def apply_sync(func, args=(), kwds={}, callback=None):
         callback(res)
 
 
+def executor_apply_async(executor):
+    """ Wrap a ``concurrent.futures.Executor`` in an ``apply_async`` function
+
+    Results are handed to ``callback`` directly from the thread that completes
+    the future, rather than through the separate task and result handler
+    threads (and their queues) that ``multiprocessing.pool`` uses.  A future
+    that fails (for example because the pool broke or the future was
+    cancelled) hands its exception to ``callback``, which ``get_async`` raises.
+    """
+
+    def apply_async(func, args=(), kwds={}, callback=None):
+        def done(future):
+            try:
+                result = future.result()
+            except BaseException as e:
+                result = e
+            callback(result)
+
+        future = executor.submit(func, *args, **kwds)
+        if callback is not None:
+            future.add_done_callback(done)
+
+    return apply_async
+
+
 def get_sync(dsk, keys, **kwargs):
     """A naive synchronous version of get_async
 
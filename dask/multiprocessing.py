@@ -1,16 +1,19 @@
 from __future__ import absolute_import, division, print_function
 
+from concurrent.futures import Executor
 import multiprocessing
+import os
 import traceback
 import pickle
 import sys
+from threading import Lock
 from warnings import warn
 
 import cloudpickle
 
 from . import config
 from .compatibility import copyreg
-from .local import get_async  # TODO: get better get
+from .local import get_async, executor_apply_async  # TODO: get better get
 from .optimization import fuse, cull
 
 
@@ -29,8 +32,8 @@ def _dumps(x):
 _loads = cloudpickle.loads
 
 
-def _process_get_id():
-    return multiprocessing.current_process().ident
+# Same value as ``multiprocessing.current_process().ident`` in a worker
+_process_get_id = os.getpid
 
 
 # -- Remote Exception Handling --
@@ -139,6 +142,20 @@ def get_context():
     return multiprocessing.get_context(context_name)
 
 
+# Pools kept alive between calls when ``multiprocessing.reuse-pool`` is set,
+# keyed by multiprocessing context and number of workers
+pools = dict()
+pools_lock = Lock()
+
+
+def close_pools():
+    """ Terminate the pools kept alive by ``multiprocessing.reuse-pool`` """
+    with pools_lock:
+        for pool in pools.values():
+            pool.terminate()
+        pools.clear()
+
+
 def get(
     dsk,
     keys,
@@ -167,15 +184,37 @@ def get(
         (defaults to cloudpickle.loads)
     optimize_graph : bool
         If True [default], `fuse` is applied to the graph before computation.
+    pool : multiprocessing.Pool or concurrent.futures.ProcessPoolExecutor, optional
+        Pool of worker processes to use instead of creating a new one.  A
+        user-supplied pool is not set up with ``initialize_worker_process``,
+        so forked workers share the parent's NumPy random state unless the
+        pool was created with that initializer.
+
+    Notes
+    -----
+    By default a new pool of processes is started for every call.  Setting the
+    ``multiprocessing.reuse-pool`` config value to True keeps that pool alive
+    and reuses it for later calls with the same context and number of workers,
+    avoiding the process startup cost.  Reused workers do not see changes made
+    to module state in the parent process after they were started.  Call
+    ``close_pools`` to terminate them.
     """
     pool = pool or config.get("pool", None)
     num_workers = num_workers or config.get("num_workers", None)
+    cleanup = False
     if pool is None:
         context = get_context()
-        pool = context.Pool(num_workers, initializer=initialize_worker_process)
-        cleanup = True
-    else:
-        cleanup = False
+        if config.get("multiprocessing.reuse-pool", False):
+            with pools_lock:
+                pool = pools.get((context, num_workers))
+                if pool is None:
+                    pool = context.Pool(
+                        num_workers, initializer=initialize_worker_process
+                    )
+                    pools[(context, num_workers)] = pool
+        else:
+            pool = context.Pool(num_workers, initializer=initialize_worker_process)
+            cleanup = True
 
     # Optimize Dask
     dsk2, dependencies = cull(dsk, keys)
@@ -192,11 +231,18 @@ def get(
     # Note former versions used a multiprocessing Manager to share
     # a Queue between parent and workers, but this is fragile on Windows
     # (issue #1652).
+    if isinstance(pool, Executor):
+        apply_async = executor_apply_async(pool)
+        num_workers = pool._max_workers
+    else:
+        apply_async = pool.apply_async
+        num_workers = len(pool._pool)
+
     try:
         # Run
         result = get_async(
-            pool.apply_async,
-            len(pool._pool),
+            apply_async,
+            num_workers,
             dsk3,
             keys,
             get_id=_process_get_id,
@@ -994,6 +994,16 @@ def test_get_scheduler():
     assert get_scheduler() is None
 
 
+def test_get_scheduler_process_pool_without_cloudpickle(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    monkeypatch.delitem(named_schedulers, "processes", raising=False)
+    with ProcessPoolExecutor(1) as pool:
+        with pytest.raises(ValueError) as info:
+            get_scheduler(scheduler=pool)
+    assert "cloudpickle" in str(info.value)
+
+
 def test_callable_scheduler():
     called = [False]
 
@@ -1,8 +1,23 @@
 from __future__ import absolute_import, division, print_function
 
-import dask
+import logging
+import threading
+import time
+
+import pytest
 
-from dask.local import start_state_from_dask, get_sync, finish_task, sortkey
+import dask
+import dask.local
+
+from dask.local import (
+    start_state_from_dask,
+    get_sync,
+    get_async,
+    apply_sync,
+    executor_apply_async,
+    finish_task,
+    sortkey,
+)
 from dask.order import order
 from dask.utils_test import GetFunctionTestMixin, inc, add
 
@@ -91,6 +106,23 @@ def test_finish_task():
     }
 
 
+def test_finish_task_debug_logging(monkeypatch, caplog):
+    monkeypatch.setattr(dask.local, "DEBUG", True)
+    caplog.set_level(logging.DEBUG, logger="dask.local")
+
+    dsk = {"x": 1, "y": 2, "z": (inc, "x"), "w": (add, "z", "y")}
+    state = start_state_from_dask(dsk)
+    state["ready"].remove("z")
+    state["running"] = set(["z"])
+    state["cache"]["z"] = 2
+    finish_task(dsk, "z", state, set(), order(dsk).get)
+
+    [record] = caplog.records
+    assert record.name == "dask.local"
+    assert "Dep: x" in record.getMessage()
+    assert "Release" in record.getMessage()
+
+
 class TestGetAsync(GetFunctionTestMixin):
     get = staticmethod(get_sync)
 
@@ -98,6 +130,78 @@ class TestGetAsync(GetFunctionTestMixin):
         self.get({"x": (inc, "y"), "y": 1}, "x", num_workers=2)
 
 
+@pytest.mark.parametrize("chunksize", [1, 3, -1])
+def test_get_sync_chunksize(chunksize):
+    dsk = {("x", i): (inc, i) for i in range(10)}
+    dsk["y"] = (sum, [("x", i) for i in range(10)])
+    assert get_sync(dsk, "y", chunksize=chunksize) == 55
+    with dask.config.set(chunksize=chunksize):
+        assert get_sync(dsk, "y") == 55
+
+
+@pytest.mark.parametrize(
+    "chunksize, expected", [(1, [1] * 11), (3, [3, 3, 3, 1, 1]), (-1, [5, 5, 1])]
+)
+def test_get_async_chunksize_batches(chunksize, expected):
+    sizes = []
+
+    def apply_async(func, args=(), kwds={}, callback=None):
+        sizes.append(len(args[0]))
+        apply_sync(func, args, kwds, callback)
+
+    dsk = {("x", i): (inc, i) for i in range(10)}
+    dsk["y"] = (sum, [("x", i) for i in range(10)])
+    assert get_async(apply_async, 2, dsk, "y", chunksize=chunksize) == 55
+    assert sizes == expected
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, -1])
+def test_get_async_outstanding_batches_bounded(chunksize):
+    from concurrent.futures import ThreadPoolExecutor
+
+    num_workers = 3
+    lock = threading.Lock()
+    outstanding = [0]
+    peak = [0]
+
+    def slow_inc(x):
+        # Uneven durations so batches finish at different times
+        time.sleep(0.001 * (x % 7))
+        return x + 1
+
+    with ThreadPoolExecutor(num_workers) as pool:
+
+        def apply_async(func, args=(), kwds={}, callback=None):
+            with lock:
+                outstanding[0] += 1
+                peak[0] = max(peak[0], outstanding[0])
+
+            def done(result):
+                with lock:
+                    outstanding[0] -= 1
+                callback(result)
+
+            executor_apply_async(pool)(func, args, kwds, callback=done)
+
+        dsk = {("x", i): (slow_inc, i) for i in range(50)}
+        dsk.update({("y", i): (slow_inc, ("x", i)) for i in range(50)})
+        dsk["z"] = (sum, [("y", i) for i in range(50)])
+        result = get_async(apply_async, num_workers, dsk, "z", chunksize=chunksize)
+
+    assert result == sum(range(2, 52))
+    assert 1 < peak[0] <= num_workers
+
+
+@pytest.mark.parametrize("chunksize", [0, -2, 1.5, "2", True])
+def test_get_async_bad_chunksize(chunksize):
+    dsk = {"x": (inc, 1)}
+    with pytest.raises(ValueError, match="chunksize"):
+        get_sync(dsk, "x", chunksize=chunksize)
+    with dask.config.set(chunksize=chunksize):
+        with pytest.raises(ValueError, match="chunksize"):
+            get_sync(dsk, "x")
+
+
 def test_cache_options():
     try:
         from chest import Chest
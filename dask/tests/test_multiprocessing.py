@@ -1,5 +1,6 @@
 from __future__ import absolute_import, division, print_function
 
+import os
 import sys
 import multiprocessing
 from operator import add
@@ -11,7 +12,14 @@ import numpy as np
 import pytest
 import dask
 from dask import compute, delayed
-from dask.multiprocessing import get, _dumps, get_context, remote_exception
+from dask.multiprocessing import (
+    get,
+    _dumps,
+    close_pools,
+    get_context,
+    pools,
+    remote_exception,
+)
 from dask.utils_test import inc
 
 
@@ -107,6 +115,48 @@ def test_reuse_pool():
             assert get({"x": (inc, 1)}, "x") == 2
 
 
+def test_reuse_pool_config():
+    dsk = {"x": (os.getpid,)}
+    try:
+        with dask.config.set({"multiprocessing.reuse-pool": True}):
+            pid = get(dsk, "x", num_workers=1)
+            assert get(dsk, "x", num_workers=1) == pid
+            assert len(pools) == 1
+        assert get(dsk, "x", num_workers=1) != pid
+    finally:
+        close_pools()
+    assert not pools
+
+
+def test_process_pool_executor():
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(2) as pool:
+        assert get({"x": (inc, 1)}, "x", pool=pool) == 2
+        with dask.config.set(pool=pool):
+            assert get({"x": (inc, 1)}, "x") == 2
+        assert compute(delayed(inc)(1), scheduler=pool) == (2,)
+
+
+def _exit_worker():
+    os._exit(1)
+
+
+def test_process_pool_executor_broken():
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    with ProcessPoolExecutor(2) as pool:
+        with pytest.raises(BrokenProcessPool):
+            get({"x": (_exit_worker,)}, "x", pool=pool)
+
+
+@pytest.mark.parametrize("chunksize", [3, -1])
+def test_chunksize(chunksize):
+    dsk = {"x%d" % i: (inc, i) for i in range(8)}
+    assert get(dsk, list(dsk), chunksize=chunksize) == tuple(range(1, 9))
+
+
 def test_dumps_loads():
     with dask.config.set(func_dumps=pickle.dumps, func_loads=pickle.loads):
         assert get({"x": 1, "y": (add, "x", 2)}, "y") == 3
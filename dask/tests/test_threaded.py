@@ -9,6 +9,7 @@ import pytest
 
 import dask
 from dask.compatibility import PY2
+import dask.threaded
 from dask.threaded import get
 from dask.utils_test import inc, add
 
@@ -75,6 +76,27 @@ def test_pool_kwarg():
         assert get(dsk, "x", pool=pool) == 3
 
 
+def test_executor_pool_kwarg():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def f():
+        sleep(0.01)
+        return threading.get_ident()
+
+    dsk = {("x", i): (f,) for i in range(30)}
+    dsk["x"] = (len, (set, [("x", i) for i in range(len(dsk))]))
+
+    with ThreadPoolExecutor(3) as pool:
+        assert get(dsk, "x", pool=pool) == 3
+        assert dask.compute(dask.delayed(inc)(1), scheduler=pool) == (2,)
+
+
+@pytest.mark.parametrize("chunksize", [3, -1])
+def test_chunksize(chunksize):
+    dsk = {"x%d" % i: (inc, i) for i in range(8)}
+    assert get(dsk, list(dsk), chunksize=chunksize) == tuple(range(1, 9))
+
+
 def test_threaded_within_thread():
     L = []
 
@@ -157,6 +179,9 @@ def test_interrupt():
     def long_task():
         sleep(5)
 
+    get({"x": (inc, 1)}, "x")
+    pool = dask.threaded.default_pool
+
     dsk = {("x", i): (long_task,) for i in range(20)}
     dsk["x"] = (len, list(dsk.keys()))
     try:
@@ -171,3 +196,8 @@ def test_interrupt():
     stop = time()
     if stop - start > 4:
         assert False, "Failed to interrupt"
+
+    # The interrupted pool is shut down and replaced on the next call
+    assert dask.threaded.default_pool is None
+    assert pool._shutdown
+    assert get({"x": (inc, 1)}, "x") == 2
@@ -5,23 +5,27 @@ See local.py
 """
 from __future__ import absolute_import, division, print_function
 
+import os
 import sys
 from collections import defaultdict
-from multiprocessing.pool import ThreadPool
+from concurrent.futures import Executor, ThreadPoolExecutor
 import threading
-from threading import current_thread, Lock
+from threading import current_thread, get_ident, Lock
 
 from . import config
-from .local import get_async
+from .local import get_async, executor_apply_async
 from .utils_test import inc, add  # noqa: F401
 
 
-def _thread_get_id():
-    return current_thread().ident
+# Same value as ``current_thread().ident``, without looking up the Thread
+_thread_get_id = get_ident
 
 
+CPU_COUNT = os.cpu_count() or 1
+
 main_thread = current_thread()
 default_pool = None
+default_pool_lock = Lock()
 pools = defaultdict(dict)
 pools_lock = Lock()
 
@@ -30,6 +34,13 @@ def pack_exception(e, dumps):
     return e, sys.exc_info()[2]
 
 
+def _shutdown_pool(pool):
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:  # Python < 3.9
+        pool.shutdown(wait=False)
+
+
 def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
     """ Threaded cached implementation of dask.get
 
@@ -41,7 +52,10 @@ def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
     result: key or list of keys
         Keys corresponding to desired data
     num_workers: integer of thread count
-        The number of threads to use in the ThreadPool that will actually execute tasks
+        The number of threads to use in the thread pool that will actually execute tasks
+    pool: Executor or ThreadPool (optional)
+        A ``concurrent.futures.Executor`` or ``multiprocessing.pool.ThreadPool``
+        to run tasks on instead of the cached default pool
     cache: dict-like (optional)
         Temporary storage of results
 
@@ -59,36 +73,62 @@ def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
     num_workers = num_workers or config.get("num_workers", None)
     thread = current_thread()
 
-    with pools_lock:
-        if pool is None:
-            if num_workers is None and thread is main_thread:
-                if default_pool is None:
-                    default_pool = ThreadPool()
-                pool = default_pool
-            elif thread in pools and num_workers in pools[thread]:
-                pool = pools[thread][num_workers]
-            else:
-                pool = ThreadPool(num_workers)
-                pools[thread][num_workers] = pool
-
-    results = get_async(
-        pool.apply_async,
-        len(pool._pool),
-        dsk,
-        result,
-        cache=cache,
-        get_id=_thread_get_id,
-        pack_exception=pack_exception,
-        **kwargs
-    )
+    if pool is None:
+        if num_workers is None and thread is main_thread:
+            if default_pool is None:
+                with default_pool_lock:
+                    if default_pool is None:
+                        default_pool = ThreadPoolExecutor(CPU_COUNT)
+            pool = default_pool
+        else:
+            with pools_lock:
+                if thread in pools and num_workers in pools[thread]:
+                    pool = pools[thread][num_workers]
+                else:
+                    pool = ThreadPoolExecutor(num_workers or CPU_COUNT)
+                    pools[thread][num_workers] = pool
+
+    if isinstance(pool, Executor):
+        apply_async = executor_apply_async(pool)
+        n = pool._max_workers
+    else:
+        apply_async = pool.apply_async
+        n = len(pool._pool)
+
+    try:
+        results = get_async(
+            apply_async,
+            n,
+            dsk,
+            result,
+            cache=cache,
+            get_id=_thread_get_id,
+            pack_exception=pack_exception,
+            **kwargs
+        )
+    except KeyboardInterrupt:
+        # Discard pools we own and cancel their queued tasks, so that exiting
+        # only waits for the tasks that are already running
+        owned = False
+        with default_pool_lock:
+            if pool is default_pool:
+                default_pool = None
+                owned = True
+        with pools_lock:
+            if pools.get(thread, {}).get(num_workers) is pool:
+                del pools[thread][num_workers]
+                owned = True
+        if owned:
+            _shutdown_pool(pool)
+        raise
 
     # Cleanup pools associated to dead threads
-    with pools_lock:
-        active_threads = set(threading.enumerate())
-        if thread is not main_thread:
+    if thread is not main_thread:
+        with pools_lock:
+            active_threads = set(threading.enumerate())
             for t in list(pools):
                 if t not in active_threads:
                     for p in pools.pop(t).values():
-                        p.close()
+                        p.shutdown(wait=False)
 
     return results